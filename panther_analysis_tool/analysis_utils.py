@@ -4,7 +4,7 @@ import json
 import logging
 import os
 from fnmatch import fnmatch
-from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Set, Tuple
 
 from ruamel.yaml import YAML
 from ruamel.yaml import parser as YAMLParser
@@ -32,6 +32,10 @@ from panther_analysis_tool.constants import (
 )
 from panther_analysis_tool.util import is_simple_detection
 
+# json.dumps only reuses its shared encoder when called with default options, so keep
+# a single strict encoder around for the batched backend payloads instead of building one per spec
+STRICT_JSON_ENCODER = json.JSONEncoder(allow_nan=False)
+
 
 class ClassifiedAnalysis:
     def __init__(self, file_name: str, dir_name: str, analysis_spec: Dict[str, Any]):
@@ -319,18 +323,18 @@ def load_analysis_specs_ex(
     Yields:
         An instance of LoadAnalysisSpecsResult.
     """
-    # setup a list of paths to ensure we do not import the same files
-    # multiple times, which can happen when testing from root directory without filters
     ignored_normalized = ["dependabot.yml", "package.json", "package-lock.json"]
     for file in ignore_files:
         ignored_normalized.append(os.path.normpath(file))
 
-    loaded_specs: List[Any] = []
+    # setup a set of paths to ensure we do not import the same files
+    # multiple times, which can happen when testing from root directory without filters
+    loaded_specs: Set[str] = set()
     for directory in directories:
         for relative_path, _, file_list in os.walk(directory):
             # Skip hidden folders
             if (
-                relative_path.split("/")[-1].startswith(".")
+                relative_path.rpartition("/")[2].startswith(".")
                 and relative_path != "./"
                 and relative_path != "."
             ):
@@ -370,7 +374,7 @@ def load_analysis_specs_ex(
                 if relative_name in ignored_normalized:
                     logging.info("ignoring file %s", relative_name)
                     continue
-                loaded_specs.append(spec_filename)
+                loaded_specs.add(spec_filename)
                 # setup yaml object
                 yaml = get_yaml_loader(roundtrip=roundtrip_yaml)
                 if fnmatch(filename, "*.y*ml"):
@@ -406,7 +410,7 @@ def get_simple_detections_as_python(
     """Returns simple detections with transpiled Python."""
     enriched_specs = []
     if backend is not None:
-        batch = [json.dumps(spec.analysis_spec, allow_nan=False) for spec in specs]
+        batch = [STRICT_JSON_ENCODER.encode(spec.analysis_spec) for spec in specs]
         try:
             params = TranspileToPythonParams(data=batch)
             response = backend.transpile_simple_detection_to_python(params)
@@ -518,7 +522,7 @@ def transpile_inline_filters(
 
     if backend is not None:
         batch = [
-            json.dumps(d.analysis_spec.get("InlineFilters"), allow_nan=False)
+            STRICT_JSON_ENCODER.encode(d.analysis_spec.get("InlineFilters"))
             for d in all_detections_with_filters
         ]
         try:
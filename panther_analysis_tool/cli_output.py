@@ -50,18 +50,19 @@ def failed(text: str) -> str:
 
 
 def multipart_error_msg(result: BackendMultipartError, msg: str) -> str:
-    return_str = "\n-----\n"
+    parts = ["\n-----\n"]
 
     if result.has_error():
-        return_str += f"{bold('Error')}: {result.get_error()}\n-----\n"
+        parts.append(f"{bold('Error')}: {result.get_error()}\n-----\n")
 
     for issue in result.get_issues():
-        if issue.path and issue.path != "":
-            return_str += f"{bold('Path')}: {issue.path}\n"
+        if issue.path:
+            parts.append(f"{bold('Path')}: {issue.path}\n")
 
-        if issue.error_message and issue.error_message != "":
-            return_str += f"{bold('Error')}: {issue.error_message}\n"
+        if issue.error_message:
+            parts.append(f"{bold('Error')}: {issue.error_message}\n")
 
-        return_str += "-----\n"
+        parts.append("-----\n")
 
-    return f"{return_str}\n{failed(msg)}"
+    parts.append(f"\n{failed(msg)}")
+    return "".join(parts)
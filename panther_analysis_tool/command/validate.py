@@ -22,12 +22,12 @@ def run(backend: BackendClient, args: argparse.Namespace) -> Tuple[int, str]:
     chunks = analysis_chunks(typed_args)
     buffer = io.BytesIO()
 
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_out:
+    # this archive only lives for a single request, so favor compression speed over size
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zip_out:
         for name in chunks[0].files:
             zip_out.write(name)
 
-    buffer.seek(0, 0)
-    params = BulkUploadParams(zip_bytes=buffer.read())
+    params = BulkUploadParams(zip_bytes=buffer.getvalue())
 
     try:
         result = backend.bulk_validate(params)
@@ -18,13 +18,14 @@ import typing  # 'from typing import Optional' conflicts with 'from schema impor
 import zipfile
 from collections import defaultdict
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 
 # Comment below disabling pylint checks is due to a bug in the CircleCi image with Pylint
 # It seems to be unable to import the distutils module, however the module is present and importable
 # in the Python Repl.
 from distutils.util import strtobool  # pylint: disable=E0611, E0401
+from functools import lru_cache
 from importlib.abc import Loader
 from typing import Any, DefaultDict, Dict, List, Tuple, Type
 from unittest.mock import MagicMock, patch
@@ -174,7 +175,7 @@ class AnalysisContainsInvalidTableNamesException(Exception):
         super().__init__(self.message)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResultContainer:
     detection: typing.Optional[Detection]
     result: TestResult
@@ -188,6 +189,8 @@ class TestResultsContainer:
 
     passed: Dict[str, List[TestResultContainer]]
     errored: Dict[str, List[TestResultContainer]]
+    # passing results are never printed when only failures are requested, so skip buffering them
+    include_passed: bool = True
 
 
 def load_module(filename: str) -> Tuple[Any, Any]:
@@ -405,7 +408,9 @@ def upload_zip(
                 except BaseException:
                     del resp_dict["correlation_rules"]
 
-                logging.debug("API Response:\n%s", json.dumps(resp_dict, indent=4))
+                # only pay for encoding the response when it will actually be logged
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("API Response:\n%s", json.dumps(resp_dict, indent=4))
                 print_upload_summary(resp_dict)
                 return 0, cli_output.success("Upload succeeded")
 
@@ -816,7 +821,9 @@ def test_analysis(
     all_test_results = (
         None
         if not bool(args.sort_test_results | args.print_failed_test_results_only)
-        else TestResultsContainer(passed={}, errored={})
+        else TestResultsContainer(
+            passed={}, errored={}, include_passed=not args.print_failed_test_results_only
+        )
     )
     # then, import rules and policies; run tests
     failed_tests, invalid_detections, skipped_tests = setup_run_tests(
@@ -1634,11 +1641,11 @@ def _process_correlation_rule_test_results(
         if not test_case_passed:
             failed_tests[detection_id].append(f"{test_result.name}")
         if all_test_results:
+            if test_result.passed and not all_test_results.include_passed:
+                continue
             test_result_str = status_passed if test_result.passed else status_errored
             stored_test_results = getattr(all_test_results, test_result_str)
-            if detection_id not in stored_test_results:
-                stored_test_results[detection_id] = []
-            stored_test_results[detection_id].append(
+            stored_test_results.setdefault(detection_id, []).append(
                 TestResultContainer(
                     detection=None,
                     result=test_result,
@@ -1745,11 +1752,11 @@ def _run_tests(  # pylint: disable=too-many-arguments
             test_result.functions.referenceFunction = None
 
         if all_test_results:
+            if test_result.passed and not all_test_results.include_passed:
+                continue
             test_result_str = status_passed if test_result.passed else status_errored
             stored_test_results = getattr(all_test_results, test_result_str)
-            if test_result.detectionId not in stored_test_results:
-                stored_test_results[test_result.detectionId] = []
-            stored_test_results[test_result.detectionId].append(
+            stored_test_results.setdefault(test_result.detectionId, []).append(
                 TestResultContainer(
                     detection=detection,
                     result=test_result,
@@ -1763,6 +1770,17 @@ def _run_tests(  # pylint: disable=too-many-arguments
     return failed_tests
 
 
+@lru_cache(maxsize=None)
+def _function_result_names(functions_type: Type[Any]) -> Tuple[Tuple[str, str], ...]:
+    """Returns (field name, printable name) pairs for a per-function results dataclass.
+
+    dataclasses.fields() rebuilds its tuple on every call, so resolve it once per type.
+    """
+    return tuple(
+        (field.name, field.name.replace("Function", "")) for field in fields(functions_type)
+    )
+
+
 def _print_test_result(
     detection: typing.Optional[Detection],
     test_result: TestResult,
@@ -1782,25 +1800,25 @@ def _print_test_result(
         return
 
     # print function output and status as necessary
-    functions = asdict(test_result.functions)
-    for function_name, function_result in functions.items():
-        printable_name = function_name.replace("Function", "")
+    # read the per-function results straight off the dataclass, asdict would deep copy all of them
+    functions_type = type(test_result.functions)
+    for function_name, printable_name in _function_result_names(functions_type):  # type: ignore[arg-type]
+        function_result = getattr(test_result.functions, function_name)
+        if function_result is None:
+            continue
         if printable_name == "detection":
             # extract this detections matcher function name
             printable_name = detection.matcher_function_name
-        if function_result:
-            if function_result.get("error"):
-                # add this as output to the failed test spec as well
-                failed_tests[detection.detection_id].append(f"{test_result.name}:{printable_name}")
-                print(
-                    f'\t\t[{status_fail}] [{printable_name}] {function_result.get("error", {}).get("message")}'
-                )
-            # if it didn't error, we simply need to check if the output was as expected
-            elif not function_result.get("matched", True):
-                failed_tests[detection.detection_id].append(f"{test_result.name}:{printable_name}")
-                print(f'\t\t[{status_fail}] [{printable_name}] {function_result.get("output")}')
-            else:
-                print(f'\t\t[{status_pass}] [{printable_name}] {function_result.get("output")}')
+        if function_result.error is not None:
+            # add this as output to the failed test spec as well
+            failed_tests[detection.detection_id].append(f"{test_result.name}:{printable_name}")
+            print(f"\t\t[{status_fail}] [{printable_name}] {function_result.error.message}")
+        # if it didn't error, we simply need to check if the output was as expected
+        elif not function_result.matched:
+            failed_tests[detection.detection_id].append(f"{test_result.name}:{printable_name}")
+            print(f"\t\t[{status_fail}] [{printable_name}] {function_result.output}")
+        else:
+            print(f"\t\t[{status_pass}] [{printable_name}] {function_result.output}")
 
 
 def setup_parser() -> argparse.ArgumentParser:
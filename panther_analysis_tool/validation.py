@@ -1,17 +1,31 @@
 import logging
 import re
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from nested_lookup import nested_lookup
-from sqlfluff import parse
-from sqlfluff.core.config import FluffConfig
 
 from panther_analysis_tool.analysis_utils import ClassifiedAnalysisContainer
 from panther_analysis_tool.constants import SET_FIELDS
 
+if TYPE_CHECKING:
+    from sqlfluff.core.config import FluffConfig
+
 # This file was generated in whole or in part by GitHub Copilot.
 
-SQLFLUFF_COMFIG = FluffConfig(overrides={"dialect": "snowflake", "templater": "jinja"})
+
+@lru_cache(maxsize=None)
+def get_sqlfluff_config() -> "FluffConfig":
+    """Builds the sqlfluff config on first use.
+
+    Importing and configuring sqlfluff takes a noticeable part of CLI startup, and is only
+    needed when a query is actually validated.
+    """
+    from sqlfluff.core.config import (  # pylint: disable=import-outside-toplevel
+        FluffConfig,
+    )
+
+    return FluffConfig(overrides={"dialect": "snowflake", "templater": "jinja"})
 
 
 def contains_invalid_field_set(analysis_spec: Any) -> List[str]:
@@ -39,8 +53,10 @@ def contains_invalid_table_names(
     invalid_table_names = []
     query = lookup_snowflake_query(analysis_spec)
     if query is not None:
+        from sqlfluff import parse  # pylint: disable=import-outside-toplevel
+
         try:
-            parsed_query = parse(query, config=SQLFLUFF_COMFIG)
+            parsed_query = parse(query, config=get_sqlfluff_config())
         except Exception:  # pylint: disable=broad-except
             # Intentionally broad exception catch:
             # We want to fall back on original behavior if this third-party parser cannot tell us the table names
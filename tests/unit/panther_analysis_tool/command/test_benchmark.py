@@ -13,6 +13,9 @@ from panther_analysis_tool.backend.client import (
 )
 from panther_analysis_tool.backend.mocks import MockBackend
 from panther_analysis_tool.command.benchmark import (
+    PerformanceTestIteration,
+    log_output,
+    nanos_to_seconds,
     validate_hour,
     validate_log_type,
     validate_rule_count,
@@ -410,3 +413,37 @@ class TestBenchmark(unittest.TestCase):
         )
         ret = validate_hour(args, log_type, backend)
         self.assertIsInstance(ret, str)
+
+    def test_log_output_statistics(self) -> None:
+        args = argparse.Namespace(out=".")
+        hour = datetime.datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+        rule = ClassifiedAnalysis(
+            file_name="fake_file.yml",
+            dir_name="fake_dir",
+            analysis_spec={"AnalysisType": AnalysisTypes.RULE},
+        )
+        iterations = [
+            PerformanceTestIteration(read_time_nanos=1_000_000_000, processing_time_nanos=4_000),
+            PerformanceTestIteration(read_time_nanos=3_000_000_000, processing_time_nanos=2_000),
+            PerformanceTestIteration(read_time_nanos=2_000_000_000, processing_time_nanos=6_000),
+        ]
+        with mock.patch("panther_analysis_tool.command.benchmark.write_output") as write_output:
+            log_output(args, hour, iterations, rule, datetime.datetime.now())
+        to_write = write_output.call_args[0][1]
+        self.assertIn("Performance tested over 3 iterations", to_write)
+        self.assertIn("Mean read time (seconds): 2.0", to_write)
+        self.assertIn("Median read time (seconds): 2.0", to_write)
+        self.assertIn("Max read time (seconds): 3.0", to_write)
+        self.assertIn("Min read time (seconds): 1.0", to_write)
+        self.assertIn("Mean processing time (seconds): 4e-06", to_write)
+        self.assertIn("Median processing time (seconds): 4e-06", to_write)
+        self.assertIn("Max processing time (seconds): 6e-06", to_write)
+        self.assertIn("Min processing time (seconds): 2e-06", to_write)
+        self.assertIn("*** Rule fake_file.yml is: Highly performant ***", to_write)
+
+    def test_nanos_to_seconds_rounds_to_microseconds(self) -> None:
+        for nanos in [0, 1_000, 1_499, 1_500, 2_500, 123_456_789_012, 2.0e9 / 3]:
+            self.assertEqual(
+                nanos_to_seconds(nanos),
+                datetime.timedelta(microseconds=nanos / 1000).total_seconds(),
+            )
@@ -0,0 +1,45 @@
+import unittest
+
+from panther_analysis_tool.backend.client import (
+    BulkUploadIssue,
+    BulkUploadMultipartError,
+)
+from panther_analysis_tool.cli_output import multipart_error_msg
+
+BOLD = "\033[1m"
+FAIL = "\033[91m"
+ENDC = "\033[0m"
+
+
+class TestMultipartErrorMsg(unittest.TestCase):
+    def test_renders_error_and_issues(self) -> None:
+        result = BulkUploadMultipartError(
+            error="upload failed",
+            issues=[
+                BulkUploadIssue(path="rules/a.yml", error_message="bad field"),
+                BulkUploadIssue(path="rules/b.yml", error_message=""),
+                BulkUploadIssue(path="", error_message="no path"),
+            ],
+        )
+
+        self.assertEqual(
+            multipart_error_msg(result, "Upload failed"),
+            "\n-----\n"
+            f"{BOLD}Error{ENDC}: upload failed\n-----\n"
+            f"{BOLD}Path{ENDC}: rules/a.yml\n"
+            f"{BOLD}Error{ENDC}: bad field\n"
+            "-----\n"
+            f"{BOLD}Path{ENDC}: rules/b.yml\n"
+            "-----\n"
+            f"{BOLD}Error{ENDC}: no path\n"
+            "-----\n"
+            f"\n{FAIL}Upload failed{ENDC}",
+        )
+
+    def test_renders_without_error_or_issues(self) -> None:
+        result = BulkUploadMultipartError(error="")
+
+        self.assertEqual(
+            multipart_error_msg(result, "Upload failed"),
+            f"\n-----\n\n{FAIL}Upload failed{ENDC}",
+        )
@@ -2,17 +2,19 @@ import io
 import json
 import os
 import shutil
+from collections import defaultdict
 from datetime import datetime
 from unittest import mock
 
 import jsonschema
 from colorama import Fore, Style
 from panther_core.data_model import _DATAMODEL_FOLDER
+from panther_core.rule import Rule
 from pyfakefs.fake_filesystem_unittest import Pause, TestCase
 from schema import SchemaWrongKeyError
 
 from panther_analysis_tool import main as pat
-from panther_analysis_tool import util
+from panther_analysis_tool import util, validation
 from panther_analysis_tool.backend.client import (
     BackendError,
     BackendResponse,
@@ -82,6 +84,8 @@ class TestPantherAnalysisTool(TestCase):
         }
         for module_name, filename in self.global_modules.items():
             shutil.copy(filename, os.path.join(pat.TMP_HELPER_MODULE_LOCATION, f"{module_name}.py"))
+        # sqlfluff discovers its plugins on the real filesystem, so load it before faking one
+        validation.get_sqlfluff_config()
         self.setUpPyfakefs()
         self.fs.add_real_directory(FIXTURES_PATH)
         self.fs.add_real_directory(pat.TMP_HELPER_MODULE_LOCATION, read_only=False)
@@ -270,6 +274,77 @@ class TestPantherAnalysisTool(TestCase):
         self.assertEqual(return_code, 0)
         self.assertEqual(len(invalid_specs), 0)
 
+    def _run_buffered_tests(self, include_passed: bool) -> pat.TestResultsContainer:
+        # Rule writes its body to a temporary module and imports it, which needs the real filesystem
+        with Pause(self.fs):
+            rule = Rule(
+                {
+                    "id": "Test.Buffered.Rule",
+                    "body": "def rule(event):\n    return event.get('match')\n",
+                    "versionId": "v1",
+                }
+            )
+        tests = [
+            {"Name": "passes", "ExpectedResult": True, "Log": {"match": True}},
+            {"Name": "fails", "ExpectedResult": True, "Log": {"match": False}},
+        ]
+        all_test_results = pat.TestResultsContainer(
+            passed={}, errored={}, include_passed=include_passed
+        )
+        pat._run_tests(
+            {}, rule, tests, defaultdict(list), {}, [], all_test_results, [], rule.detection_id
+        )
+        return all_test_results
+
+    def test_run_tests_skips_buffering_passed_results(self):
+        all_test_results = self._run_buffered_tests(include_passed=False)
+        self.assertEqual(all_test_results.passed, {})
+        self.assertEqual(
+            [r.result.name for r in all_test_results.errored["Test.Buffered.Rule"]], ["fails"]
+        )
+
+    def test_run_tests_buffers_passed_results(self):
+        all_test_results = self._run_buffered_tests(include_passed=True)
+        self.assertEqual(
+            [r.result.name for r in all_test_results.passed["Test.Buffered.Rule"]], ["passes"]
+        )
+        self.assertEqual(
+            [r.result.name for r in all_test_results.errored["Test.Buffered.Rule"]], ["fails"]
+        )
+
+    def _process_buffered_correlation_results(
+        self, include_passed: bool
+    ) -> pat.TestResultsContainer:
+        all_test_results = pat.TestResultsContainer(
+            passed={}, errored={}, include_passed=include_passed
+        )
+        pat._process_correlation_rule_test_results(
+            "Test.Correlation.Rule",
+            [
+                {"name": "passes", "passed": True},
+                {"name": "fails", "passed": False, "error": "failed"},
+            ],
+            all_test_results,
+            defaultdict(list),
+        )
+        return all_test_results
+
+    def test_correlation_rule_results_skip_buffering_passed_results(self):
+        all_test_results = self._process_buffered_correlation_results(include_passed=False)
+        self.assertEqual(all_test_results.passed, {})
+        self.assertEqual(
+            [r.result.name for r in all_test_results.errored["Test.Correlation.Rule"]], ["fails"]
+        )
+
+    def test_correlation_rule_results_buffer_passed_results(self):
+        all_test_results = self._process_buffered_correlation_results(include_passed=True)
+        self.assertEqual(
+            [r.result.name for r in all_test_results.passed["Test.Correlation.Rule"]], ["passes"]
+        )
+        self.assertEqual(
+            [r.result.name for r in all_test_results.errored["Test.Correlation.Rule"]], ["fails"]
+        )
+
     def test_aws_profiles(self):
         aws_profile = "AWS_PROFILE"
         args = pat.setup_parser().parse_args(